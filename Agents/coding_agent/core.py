@@ -30,6 +30,10 @@ class CodingAgent:
         # Store combination data
         self.current_combination = None
         
+        # Current script is kept in memory; execution_code_*.py is only written when asked for
+        self.current_code = ""
+        self.persist_to_disk = False
+        
         # API Summary instead of full API reference
         self.api_summary = """
         # Scene Construction APIs
@@ -65,9 +69,15 @@ class CodingAgent:
                 return f.read()
         return ""
     
-    def set_combination_data(self, combination: Dict):
+    def set_combination_data(self, combination: Dict, persist_to_disk: bool = False):
         """Set the current combination data for intelligent code generation"""
         self.current_combination = combination
+        self.current_code = ""
+        self.persist_to_disk = persist_to_disk
+        # Each combination gets its own script, so combinations never overwrite each other's code
+        combination_id = combination.get("combination_id")
+        script_name = f"execution_code_{combination_id}.py" if combination_id is not None else "execution_code.py"
+        self.execution_code_path = self.project_root / script_name
         self.fixed_steps.clear()  # Reset fixed steps for new combination
         self.step_descriptions.clear()
     
@@ -194,25 +204,19 @@ class CodingAgent:
         step_code = self._extract_step_from_code(current_code, step)
         
         if step_code:
-            # Add necessary imports and setup for this step
-            imports = """import bpy
-import math
-import random
-from mathutils import Vector
-import sys
-import os
-
-# Add API path and import functions
-sys.path.append(r'{}')
-from API import *
-
-""".format(self.project_root)
-            
-            # Return just the step code with imports
-            return imports + step_code
+            # The Blender server runs steps with bpy, math, random, Vector and the API
+            # already in scope, so no per-step import header is needed
+            return step_code
         
         return None
     
+    def get_all_steps(self) -> List[dict]:
+        """Info and code of every step in the generated code"""
+        return [
+            {**self.get_step_info(step), "code": self.get_step_code(step)}
+            for step in range(1, len(self.step_descriptions) + 1)
+        ]
+    
     def _extract_step_from_code(self, code: str, step_num: int) -> Optional[str]:
         """Extract a specific step from the complete code"""
         lines = code.split('\n')
@@ -245,7 +249,7 @@ from API import *
                 return {
                     "success": False,
                     "message": "No combination data set. Please set combination data first.",
-                    "code_path": str(self.execution_code_path)
+                    "code_path": self._code_path()
                 }
             
             # Handle review results
@@ -255,7 +259,7 @@ from API import *
                     return {
                         "success": True,
                         "message": f"Step {step} passed review and marked as fixed",
-                        "code_path": str(self.execution_code_path)
+                        "code_path": self._code_path()
                     }
             
             # For step 1, generate complete code
@@ -279,7 +283,7 @@ from API import *
                 return {
                     "success": True,
                     "message": f"Generated complete scene code with {total_steps} steps",
-                    "code_path": str(self.execution_code_path),
+                    "code_path": self._code_path(),
                     "total_steps": total_steps
                 }
             
@@ -297,7 +301,7 @@ from API import *
                 return {
                     "success": True,
                     "message": f"Fixed step {step} based on review feedback",
-                    "code_path": str(self.execution_code_path)
+                    "code_path": self._code_path()
                 }
             
             # Extract and execute the specific step
@@ -306,20 +310,20 @@ from API import *
                 return {
                     "success": True,
                     "message": f"Ready to execute step {step}",
-                    "code_path": str(self.execution_code_path)
+                    "code_path": self._code_path()
                 }
             else:
                 return {
                     "success": False,
                     "message": f"Step {step} not found in generated code",
-                    "code_path": str(self.execution_code_path)
+                    "code_path": self._code_path()
                 }
             
         except Exception as e:
             return {
                 "success": False,
                 "message": f"Error generating code: {str(e)}",
-                "code_path": str(self.execution_code_path)
+                "code_path": self._code_path()
             }
     
     def _fix_step_code(self, step: int, task_description: str, review_comment: str) -> str:
@@ -441,14 +445,17 @@ from API import *
         
         return '\n'.join(new_lines)
     
+    def _code_path(self) -> Optional[str]:
+        """Path of the written script, or None when the code only lives in memory."""
+        return str(self.execution_code_path) if self.persist_to_disk else None
+    
     def _read_current_code(self) -> str:
-        """Read current execution_code.py content."""
-        if self.execution_code_path.exists():
-            with open(self.execution_code_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        return ""
+        """Return the current scene code."""
+        return self.current_code
     
     def _write_code(self, code: str):
-        """Write code to execution_code.py."""
-        with open(self.execution_code_path, 'w', encoding='utf-8') as f:
-            f.write(code)
+        """Update the current scene code, also writing execution_code.py if persisting."""
+        self.current_code = code
+        if self.persist_to_disk:
+            with open(self.execution_code_path, 'w', encoding='utf-8') as f:
+                f.write(code)
@@ -9,6 +9,7 @@ agent = CodingAgent()
 # Request/Response Models
 class SetCombinationRequest(BaseModel):
     combination: Dict
+    persist_to_disk: bool = False
 
 class SetCombinationResponse(BaseModel):
     success: bool
@@ -22,11 +23,17 @@ class GenerateCodeRequest(BaseModel):
 class GenerateCodeResponse(BaseModel):
     success: bool
     message: str
-    code_path: str
+    code_path: Optional[str] = None
     fixed_steps: Optional[List[int]] = None
     used_function: Optional[str] = None
     total_steps: Optional[int] = None
 
+class GenerateAndGetStepCodeResponse(BaseModel):
+    success: bool
+    message: str
+    code: Optional[str] = None
+    total_steps: Optional[int] = None
+
 class GetStepInfoRequest(BaseModel):
     step: int
 
@@ -43,11 +50,21 @@ class GetStepCodeResponse(BaseModel):
     code: Optional[str] = None
     message: Optional[str] = None
 
+class StepData(BaseModel):
+    step: int
+    description: str
+    is_scale_step: bool
+    code: Optional[str] = None
+
+class GetAllStepsResponse(BaseModel):
+    success: bool
+    steps: List[StepData] = []
+
 # API Endpoints
 @app.post("/set-combination", response_model=SetCombinationResponse)
 async def set_combination(req: SetCombinationRequest):
     try:
-        agent.set_combination_data(req.combination)
+        agent.set_combination_data(req.combination, req.persist_to_disk)
         return SetCombinationResponse(
             success=True,
             message="Combination data set successfully"
@@ -55,7 +72,7 @@ async def set_combination(req: SetCombinationRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/generate-code", response_model=GenerateCodeResponse)
+@app.post("/generate-code", response_model=GenerateCodeResponse, response_model_exclude_none=True)
 async def generate_code(req: GenerateCodeRequest):
     try:
         result = agent.generate_code(
@@ -68,6 +85,34 @@ async def generate_code(req: GenerateCodeRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/generate-and-get-step-code", response_model=GenerateAndGetStepCodeResponse)
+async def generate_and_get_step_code(req: GenerateCodeRequest):
+    """/generate-code followed by /get-step-code for the same step, in one request"""
+    try:
+        result = agent.generate_code(
+            step=req.step,
+            task_description=req.task_description,
+            review_result=req.review_result
+        )
+        if not result["success"]:
+            return GenerateAndGetStepCodeResponse(success=False, message=result["message"])
+        
+        code = agent.get_step_code(req.step)
+        if not code:
+            return GenerateAndGetStepCodeResponse(
+                success=False,
+                message=f"No code found for step {req.step}"
+            )
+        
+        return GenerateAndGetStepCodeResponse(
+            success=True,
+            message=result["message"],
+            code=code,
+            total_steps=result.get("total_steps")
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/get-step-info", response_model=GetStepInfoResponse)
 async def get_step_info(req: GetStepInfoRequest):
     try:
@@ -93,6 +138,14 @@ async def get_step_code(req: GetStepCodeRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/get-all-steps", response_model=GetAllStepsResponse)
+async def get_all_steps():
+    """Info and code of every generated step, so callers need one request instead of two per step"""
+    try:
+        return GetAllStepsResponse(success=True, steps=agent.get_all_steps())
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/health")
 async def health():
     return {"status": "healthy", "agent": "coding"}
@@ -2,7 +2,11 @@ import socket
 import json
 import logging
 import os
+import select
+import struct
+import threading
 from pathlib import Path
+from orjson import dumps as json_dumps, loads as json_loads
 
 class ExecutionAgent:
     """
@@ -18,6 +22,10 @@ class ExecutionAgent:
         self.timeout = timeout
         self.logger = self._setup_logger()
         self.project_root = Path(__file__).parent.parent.parent
+        
+        # One persistent connection to the Blender server, reused across calls
+        self._client = None
+        self._lock = threading.Lock()
     
     def _setup_logger(self):
         """Set up the logger."""
@@ -41,6 +49,7 @@ class ExecutionAgent:
         try:
             client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             client.settimeout(self.timeout)
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             client.connect((self.host, self.port))
             self.logger.info(f"Connected to: {self.host}:{self.port}")
             return client
@@ -48,44 +57,74 @@ class ExecutionAgent:
             self.logger.error(f"Failed to connect to Blender: {e}")
             raise ConnectionError(f"Unable to connect to Blender server: {e}")
 
+    def _recv_exact(self, client, n):
+        """Read exactly n bytes from the Blender socket."""
+        buf = bytearray()
+        while len(buf) < n:
+            chunk = client.recv(n - len(buf))
+            if not chunk:
+                raise ConnectionError("Blender closed the connection")
+            buf.extend(chunk)
+        return bytes(buf)
+
+    def _close(self):
+        """Drop the persistent Blender connection."""
+        if self._client is not None:
+            try:
+                self._client.close()
+            except OSError:
+                pass
+            self._client = None
+            self.logger.info("Connection closed")
+
+    def _request(self, payload):
+        """Send one length-prefixed frame over the persistent connection and return the reply body."""
+        # The server never sends unprompted, so a readable idle socket means Blender closed it
+        if self._client is not None and select.select([self._client], [], [], 0)[0]:
+            self._close()
+        
+        frame = struct.pack('>I', len(payload)) + payload
+        reused = self._client is not None
+        if not reused:
+            self._client = self.connect()
+        try:
+            self._client.sendall(frame)
+        except OSError:
+            self._close()
+            if not reused:
+                raise
+            # Blender never got a complete frame, so sending it again can't run the code twice
+            self._client = self.connect()
+            try:
+                self._client.sendall(frame)
+            except BaseException:
+                self._close()
+                raise
+        
+        # Once the frame is out the code may have run, so a failed reply is never retried
+        try:
+            (length,) = struct.unpack('>I', self._recv_exact(self._client, 4))
+            return self._recv_exact(self._client, length)
+        except BaseException:
+            self._close()
+            raise
+
     def execute_code(self, code):
         """
         Execute code in Blender.
         """
-        client = None
         try:
-            # Establish connection
-            client = self.connect()
-
-            # Send code
+            # Send code as a length-prefixed frame and receive the length-prefixed response
             self.logger.info("Sending code to Blender...")
             self.logger.debug(f"Code length: {len(code)} characters")
-            client.send(code.encode('utf-8'))
-
-            # Receive response with larger buffer
-            self.logger.info("Waiting for Blender response...")
-            response_parts = []
-            while True:
-                try:
-                    part = client.recv(4096)
-                    if not part:
-                        break
-                    response_parts.append(part.decode('utf-8'))
-                    # Try to parse as JSON to see if we got complete response
-                    try:
-                        json.loads(''.join(response_parts))
-                        break
-                    except json.JSONDecodeError:
-                        # Not complete yet, continue receiving
-                        continue
-                except socket.timeout:
-                    self.logger.warning("Socket timeout while receiving response")
-                    break
+            payload = json_dumps({'op': 'exec', 'code': code})
             
-            response = ''.join(response_parts)
+            self.logger.info("Waiting for Blender response...")
+            with self._lock:
+                response = self._request(payload)
             
-            # Parse JSON response
-            result = json.loads(response)
+            # Parse JSON response straight from the received bytes
+            result = json_loads(response)
             
             if result['status'] == 'success':
                 self.logger.info("Code execution successful")
@@ -106,15 +145,6 @@ class ExecutionAgent:
         except Exception as e:
             self.logger.error(f"Code execution failed: {e}")
             return None
-            
-        finally:
-            # Ensure connection is closed
-            if client:
-                try:
-                    client.close()
-                    self.logger.info("Connection closed")
-                except:
-                    pass
     
     def test_connection(self):
         """
@@ -129,6 +159,16 @@ class ExecutionAgent:
             self.logger.error(f"Connection test failed: {e}")
             return False
     
+    def ping(self, timeout: float = 2.0) -> bool:
+        """
+        Check that the Blender server accepts connections, without running anything in Blender.
+        """
+        try:
+            with socket.create_connection((self.host, self.port), timeout=timeout):
+                return True
+        except OSError:
+            return False
+    
     def execute_codes_file(self, file_path: str, capture_views: bool = True):
         if not os.path.isabs(file_path):
             file_path = self.project_root / file_path
@@ -1,11 +1,44 @@
+import asyncio
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
 from core import ExecutionAgent
 
-app = FastAPI(title="Execution Agent")
+app = FastAPI(title="Execution Agent", default_response_class=ORJSONResponse)
 agent = ExecutionAgent()
 
+# Blender runs one script at a time, so all Blender calls go through a single queued worker
+blender_jobs: Optional[asyncio.Queue] = None
+blender_worker_task: Optional[asyncio.Task] = None
+
+async def blender_worker():
+    """Run queued Blender jobs one by one and resolve their futures"""
+    while True:
+        func, args, future = await blender_jobs.get()
+        try:
+            result = await asyncio.to_thread(func, *args)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+        finally:
+            blender_jobs.task_done()
+
+async def run_in_blender(func, *args):
+    """Queue a call that talks to Blender and wait for its result"""
+    future = asyncio.get_running_loop().create_future()
+    await blender_jobs.put((func, args, future))
+    return await future
+
+@app.on_event("startup")
+async def start_blender_worker():
+    global blender_jobs, blender_worker_task
+    blender_jobs = asyncio.Queue(maxsize=100)
+    blender_worker_task = asyncio.create_task(blender_worker())
+
 class RunScriptRequest(BaseModel):
     script_path: str
 
@@ -16,6 +49,7 @@ class RunScriptResponse(BaseModel):
 
 class RunStepCodeRequest(BaseModel):
     code: str
+    capture_views: bool = False
 
 class RunStepCodeResponse(BaseModel):
     ok: bool
@@ -25,7 +59,7 @@ class RunStepCodeResponse(BaseModel):
 @app.post("/run-step-code", response_model=RunStepCodeResponse)
 async def run_step_code(req: RunStepCodeRequest):
     try:
-        res = agent.execute_step_code(req.code)
+        res = await run_in_blender(agent.execute_step_code, req.code, req.capture_views)
         
         if res is None:
             return RunStepCodeResponse(
@@ -51,7 +85,7 @@ async def run_step_code(req: RunStepCodeRequest):
 async def run_script(req: RunScriptRequest):
     try:
         # use socket to send the script to Blender
-        res = agent.execute_codes_file(req.script_path)
+        res = await run_in_blender(agent.execute_codes_file, req.script_path)
         
         if res is None:
             return RunScriptResponse(
@@ -87,11 +121,13 @@ async def run_script(req: RunScriptRequest):
 
 @app.get("/health")
 async def health():
-    # Test Blender connection
-    try:
-        if agent.test_connection():
-            return {"status": "healthy", "agent": "execution", "blender_connected": True}
-        else:
-            return {"status": "unhealthy", "agent": "execution", "blender_connected": False}
-    except:
-        return {"status": "unhealthy", "agent": "execution", "blender_connected": False}
\ No newline at end of file
+    # Only check that Blender accepts connections; running code would wait behind queued steps
+    blender_connected = await asyncio.to_thread(agent.ping)
+    worker_running = blender_worker_task is not None and not blender_worker_task.done()
+    return {
+        "status": "healthy" if blender_connected and worker_running else "unhealthy",
+        "agent": "execution",
+        "blender_connected": blender_connected,
+        "worker_running": worker_running,
+        "queued_jobs": blender_jobs.qsize() if blender_jobs is not None else 0
+    }
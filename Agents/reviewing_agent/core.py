@@ -1,91 +1,173 @@
 import os
+import re
 import json
-from anthropic import Anthropic
-import socket
+import asyncio
+import struct
+from collections import OrderedDict
+from typing import Optional
+import httpx
+from anthropic import AsyncAnthropic
+from orjson import loads as json_loads
+
+# Reference object every scale review compares against; the reviewed object is queried alongside it
+_HOUSE_NAME = 'house'
+
+# Pulls the object name out of step descriptions such as "Scale tree_1"
+_SCALE_RE = re.compile(r'[Ss]cale\s+(\w+)')
+
+# Object/house height ratios that are accepted or rejected outright; only ratios in between go to Claude
+_RATIO_ACCEPT = (0.5, 2.0)
+_RATIO_EXTREME = (0.05, 5.0)
+_TARGET_RATIO = 1.0
+
+# Blender server address and how many idle connections to it are kept open
+_BLENDER_ADDRESS = ('localhost', 8089)
+_BLENDER_POOL_SIZE = 8
+
+# Static part of the scale review prompt, sent as the system prompt
+_REVIEW_SYSTEM_PROMPT = """You are reviewing the scale of objects in a 3D scene.
+
+Real-world reference:
+- House height: typically 6-10 meters (single story: ~3m, two story: ~6-7m)
+- Tree height: varies greatly, but for residential scenes:
+  - Small ornamental trees: 3-6m
+  - Medium trees: 6-12m  
+  - Large trees: 12-20m
+- Trees near houses are usually kept at 0.5x to 2.0x the house height for aesthetic balance
+
+IMPORTANT: Consider that:
+1. A tree that's 50-200% of house height looks natural in most scenes
+2. Trees can vary greatly in size - there's no single "correct" height
+3. If the tree is within a reasonable range (0.5x to 2.0x house height), approve it
+4. Only reject if the scale is clearly wrong (e.g., tree is 10cm tall or 50m tall)
+
+Respond with JSON only:
+{"ok": true/false, "comment": "explanation"}
+
+If scaling is needed, calculate the EXACT scale factor needed from current size.
+For example, if tree is currently 10m and should be 5m, recommend scale_object('tree_1', 0.5)"""
+
+# Per-review part of the prompt; only the numeric fields change between reviews
+_REVIEW_PROMPT_TMPL = """Object being reviewed: {obj_name}
+Current scale: {scale}
+Current dimensions: height={obj_height:.2f}m
+
+House dimensions: height={house_height:.2f}m
+
+Current ratio: tree is {ratio:.2f}x the house height."""
+
+# Maximum number of review verdicts remembered for identical object dimensions
+_REVIEW_CACHE_SIZE = 1024
+
+
+# Anthropic client shared by every agent instance in this process so its connection pool is reused
+_client: Optional[AsyncAnthropic] = None
+
+
+def _get_client() -> AsyncAnthropic:
+    """Create the shared Anthropic client on first use."""
+    global _client
+    if _client is None:
+        api_key = os.getenv("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise RuntimeError("Missing ANTHROPIC_API_KEY environment variable")
+        # Bounded keep-alive pool so concurrent reviews reuse TLS connections to the API
+        _client = AsyncAnthropic(
+            api_key=api_key,
+            max_retries=2,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                timeout=httpx.Timeout(15.0, connect=3.0),
+            ),
+        )
+    return _client
+
 
 class ReviewingAgent:
     """
     ReviewingAgent using bounding box data instead of images to review object scales
     """
 
-    def __init__(self):
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise RuntimeError("Missing ANTHROPIC_API_KEY environment variable")
-        self.client = Anthropic(api_key=api_key)
-        self.model = "claude-3-haiku-20240307"
+    def __init__(self, model: str = "claude-3-haiku-20240307"):
+        self.client = _get_client()
+        self.model = model
         
-    def _get_scene_bbox_data(self) -> dict:
-        """
-        Get bounding box data from Blender via socket connection
-        """
-        # Code to get bounding box data from Blender
-        code = """
-import bpy
-from mathutils import Vector
-
-def get_object_bbox_data(obj_name):
-    obj = bpy.data.objects.get(obj_name)
-    if not obj:
-        return None
-    
-    # Get bounding box corners in world space
-    bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-    
-    # Calculate dimensions
-    min_x = min(corner.x for corner in bbox_corners)
-    max_x = max(corner.x for corner in bbox_corners)
-    min_y = min(corner.y for corner in bbox_corners)
-    max_y = max(corner.y for corner in bbox_corners)
-    min_z = min(corner.z for corner in bbox_corners)
-    max_z = max(corner.z for corner in bbox_corners)
-    
-    width = max_x - min_x
-    depth = max_y - min_y
-    height = max_z - min_z
-    
-    return {
-        'name': obj_name,
-        'width': width,
-        'depth': depth,
-        'height': height,
-        'volume': width * depth * height,
-        'location': list(obj.location),
-        'scale': list(obj.scale)
-    }
-
-# Get data for all relevant objects
-bbox_data = {}
-for obj_name in ['house', 'tree_1', 'tree_2', 'tree_3', 'tree_4', 'tree_5']:
-    data = get_object_bbox_data(obj_name)
-    if data:
-        bbox_data[obj_name] = data
-
-_result = bbox_data
-"""
+        # Verdicts keyed on (object, rounded heights, rounded scale); reviews run at temperature 0
+        self._review_cache: OrderedDict = OrderedDict()
+        
+        # (object type, ratio rounded to 0.1) pairs Claude has already approved
+        self._approved_ratios = set()
         
-        # Connect to Blender and execute
+        # Idle (reader, writer) pairs to the Blender server, reused across reviews
+        self._pool: asyncio.Queue = asyncio.Queue(maxsize=_BLENDER_POOL_SIZE)
+        
+    async def _acquire(self, fresh: bool = False):
+        """Take an idle Blender connection from the pool, or open a new one"""
+        if not fresh:
+            try:
+                return self._pool.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        return await asyncio.wait_for(
+            asyncio.open_connection(*_BLENDER_ADDRESS), timeout=10
+        )
+
+    def _release(self, conn):
+        """Return a healthy connection to the pool, closing it if the pool is full"""
         try:
-            client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            client.settimeout(10)
-            client.connect(('localhost', 8089))
-            client.send(code.encode('utf-8'))
-            
-            # Receive response
-            response_parts = []
-            while True:
-                part = client.recv(4096)
-                if not part:
-                    break
-                response_parts.append(part.decode('utf-8'))
-                try:
-                    json.loads(''.join(response_parts))
-                    break
-                except json.JSONDecodeError:
-                    continue
+            self._pool.put_nowait(conn)
+        except asyncio.QueueFull:
+            conn[1].close()
+
+    async def fill_blender_pool(self):
+        """Open connections up to the pool size; Blender may not be up yet, which is fine"""
+        while not self._pool.full():
+            try:
+                conn = await asyncio.wait_for(
+                    asyncio.open_connection(*_BLENDER_ADDRESS), timeout=10
+                )
+            except Exception as e:
+                print(f"Could not pre-open Blender connection: {e}")
+                return
+            self._pool.put_nowait(conn)
+
+    async def warm_up_client(self):
+        """Open one API connection ahead of the first review; failures are left to the real call"""
+        try:
+            await self.client.models.list(limit=1)
+        except Exception as e:
+            print(f"Could not warm up Anthropic connection: {e}")
+
+    async def _blender_request(self, payload: bytes) -> dict:
+        """Send one length-prefixed request over a pooled connection and decode the reply"""
+        for attempt in range(2):
+            reader, writer = await self._acquire(fresh=attempt > 0)
+            try:
+                writer.write(struct.pack('>I', len(payload)) + payload)
+                await writer.drain()
+                header = await asyncio.wait_for(reader.readexactly(4), timeout=10)
+                (length,) = struct.unpack('>I', header)
+                body = await asyncio.wait_for(reader.readexactly(length), timeout=10)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # Pooled connection was dropped by Blender; retry once on a fresh one
+                writer.close()
+                if attempt:
+                    raise
+                continue
+            except BaseException:
+                writer.close()
+                raise
             
-            response = ''.join(response_parts)
-            result = json.loads(response)
+            self._release((reader, writer))
+            return json_loads(body)
+
+    async def _get_scene_bbox_data(self, names) -> dict:
+        """
+        Get bounding box data for the named objects from Blender via socket connection
+        """
+        try:
+            payload = json.dumps({'op': 'bbox', 'names': list(names)}).encode('utf-8')
+            result = await self._blender_request(payload)
             
             if result.get('status') == 'success' and result.get('data'):
                 return result['data']
@@ -95,11 +177,8 @@ _result = bbox_data
         except Exception as e:
             print(f"Error getting bbox data: {e}")
             return {}
-        finally:
-            if 'client' in locals():
-                client.close()
 
-    def review(self, step: int, description: str, edit_hint: str) -> dict:
+    async def review(self, step: int, description: str, edit_hint: str) -> dict:
         """
         Review the step using bounding box data instead of images
         """
@@ -108,72 +187,81 @@ _result = bbox_data
         # This step doesn't need review - it's just random placement
             return {"ok": True, "comment": "Random placement step - no review needed"}
     
-        # Get bounding box data from the scene
-        bbox_data = self._get_scene_bbox_data()
-        
-        if not bbox_data:
-            return {"ok": False, "comment": "Failed to get scene data from Blender"}
-        
         # Extract the object being reviewed from the description
-        import re
-        obj_match = re.search(r'[Ss]cale\s+(\w+)', description)
+        obj_match = _SCALE_RE.search(description)
         if not obj_match:
             return {"ok": True, "comment": "Not a scaling step"}
         
         obj_name = obj_match.group(1)
         
+        # Get bounding box data from the scene (only scaling steps need it)
+        bbox_data = await self._get_scene_bbox_data(dict.fromkeys((_HOUSE_NAME, obj_name)))
+        
+        if not bbox_data:
+            return {"ok": False, "comment": "Failed to get scene data from Blender"}
+        
         # Check if we have data for this object and the house
         if obj_name not in bbox_data:
             return {"ok": False, "comment": f"Object {obj_name} not found in scene"}
         
-        if 'house' not in bbox_data:
+        if _HOUSE_NAME not in bbox_data:
             return {"ok": True, "comment": "No house in scene to compare against"}
         
         # Get dimensions
-        house_data = bbox_data['house']
+        house_data = bbox_data[_HOUSE_NAME]
         obj_data = bbox_data[obj_name]
+        ratio = obj_data['height'] / house_data['height']
         
-        # Build prompt for Claude - IMPROVED VERSION with better tolerance
-        prompt = f"""You are reviewing the scale of objects in a 3D scene.
-
-Object being reviewed: {obj_name}
-Current scale: {obj_data['scale']}
-Current dimensions: height={obj_data['height']:.2f}m
-
-House dimensions: height={house_data['height']:.2f}m
-
-Real-world reference:
-- House height: typically 6-10 meters (single story: ~3m, two story: ~6-7m)
-- Tree height: varies greatly, but for residential scenes:
-  - Small ornamental trees: 3-6m
-  - Medium trees: 6-12m  
-  - Large trees: 12-20m
-- Trees near houses are usually kept at 0.5x to 2.0x the house height for aesthetic balance
-
-Current ratio: tree is {obj_data['height']/house_data['height']:.2f}x the house height.
-
-IMPORTANT: Consider that:
-1. A tree that's 50-200% of house height looks natural in most scenes
-2. Trees can vary greatly in size - there's no single "correct" height
-3. If the tree is within a reasonable range (0.5x to 2.0x house height), approve it
-4. Only reject if the scale is clearly wrong (e.g., tree is 10cm tall or 50m tall)
-
-Respond with JSON only:
-{{"ok": true/false, "comment": "explanation"}}
-
-If scaling is needed, calculate the EXACT scale factor needed from current size.
-For example, if tree is currently 10m and should be 5m, recommend scale_object('tree_1', 0.5)"""
+        # Clear-cut ratios are decided without asking Claude
+        if _RATIO_ACCEPT[0] <= ratio <= _RATIO_ACCEPT[1]:
+            return {"ok": True, "comment": f"Ratio {ratio:.2f} is within the {_RATIO_ACCEPT[0]}-{_RATIO_ACCEPT[1]}x house height band"}
+        if ratio < _RATIO_EXTREME[0] or ratio > _RATIO_EXTREME[1]:
+            # scale_object is absolute, so scale the current factor to reach the target ratio
+            target_scale = obj_data['scale'][2] * _TARGET_RATIO / ratio
+            return {
+                "ok": False,
+                "comment": f"Extreme ratio {ratio:.2f}x the house height; recommend scale_object('{obj_name}', {target_scale:.2f})"
+            }
+        
+        # Identical dimensions always get the same verdict, so reuse it
+        cache_key = (
+            obj_name,
+            round(obj_data['height'], 2),
+            round(house_data['height'], 2),
+            tuple(round(v, 3) for v in obj_data['scale'])
+        )
+        cached = self._review_cache.get(cache_key)
+        if cached is not None:
+            self._review_cache.move_to_end(cache_key)
+            return dict(cached)
+        
+        # An object of the same type at the same house ratio was already judged fine
+        prefix, _, suffix = obj_name.rpartition('_')
+        obj_type = prefix if prefix and suffix.isdigit() else obj_name
+        ratio_key = (obj_type, round(ratio, 1))
+        if ratio_key in self._approved_ratios:
+            return {"ok": True, "comment": f"Ratio {ratio:.2f} matches a previously approved {obj_type} scale"}
+        
+        # Build prompt for Claude
+        prompt = _REVIEW_PROMPT_TMPL.format(
+            obj_name=obj_name,
+            scale=obj_data['scale'],
+            obj_height=obj_data['height'],
+            house_height=house_data['height'],
+            ratio=ratio
+        )
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model=self.model,
+                system=_REVIEW_SYSTEM_PROMPT,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=300,
                 temperature=0.0,
             )
             
             text = response.content[0].text.strip()
-            result = json.loads(text)
+            result = json_loads(text)
             
             # Ensure proper format
             if not isinstance(result, dict) or "ok" not in result:
@@ -183,6 +271,12 @@ For example, if tree is currently 10m and should be 5m, recommend scale_object('
             if "comment" not in result:
                 result["comment"] = "No comment provided"
             
+            if result["ok"]:
+                self._approved_ratios.add(ratio_key)
+            self._review_cache[cache_key] = dict(result)
+            if len(self._review_cache) > _REVIEW_CACHE_SIZE:
+                self._review_cache.popitem(last=False)
+            
             return result
             
         except Exception as e:
@@ -1,8 +1,9 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from core import ReviewingAgent
 
-app = FastAPI(title="Reviewing Agent")
+app = FastAPI(title="Reviewing Agent", default_response_class=ORJSONResponse)
 agent = ReviewingAgent()
 
 class ReviewRequest(BaseModel):
@@ -14,12 +15,20 @@ class ReviewResponse(BaseModel):
     ok: bool
     comment: str
 
+@app.on_event("startup")
+async def open_blender_connections():
+    await agent.fill_blender_pool()
+
+@app.on_event("startup")
+async def warm_up_anthropic_connection():
+    await agent.warm_up_client()
+
 # In reviewing_agent/main.py
 
 @app.post("/review", response_model=ReviewResponse)
 async def review(req: ReviewRequest):
     try:
-        result = agent.review(req.step, req.description, req.edit_hint)
+        result = await agent.review(req.step, req.description, req.edit_hint)
         
         # Ensure result has correct format
         if not isinstance(result, dict):
@@ -43,4 +52,10 @@ async def review(req: ReviewRequest):
         return ReviewResponse(
             ok=False,
             comment=f"Review agent error: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+if __name__ == "__main__":
+    import uvicorn
+    # Single worker: the agent keeps its caches and connection pools in-process
+    uvicorn.run("main:app", host="0.0.0.0", port=8002, loop="auto", http="auto",
+                workers=1, access_log=False)
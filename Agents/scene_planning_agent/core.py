@@ -1,10 +1,63 @@
+import asyncio
+import copy
 import csv
+import functools
 import json
 import random
 import os
+import re
+from collections import OrderedDict
 from typing import List, Dict, Optional
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 from pathlib import Path
+from orjson import loads as json_loads
+
+
+# JSON object in a model reply, either inside a ``` / ```json fence or bare
+_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```|(\{.*\})", re.S)
+
+# Maximum number of parsed scene descriptions remembered per agent
+_PARSE_CACHE_SIZE = 2048
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_assets_csv(csv_path: str, mtime_ns: int, size: int) -> Dict[str, Dict[str, List[str]]]:
+    """Parse assets.csv; mtime and size are part of the cache key so edits invalidate it."""
+    assets_by_tag = {}
+    
+    with open(csv_path, 'r', encoding='utf-8', newline='') as csvfile:
+        # Plain reader with header positions avoids building a dict per row
+        reader = csv.reader(csvfile)
+        header = next(reader, [])
+        path_idx = header.index('file path')
+        name_idx = header.index('file name')
+        tag_idx = header.index('tag')
+        
+        for row in reader:
+            if not row:
+                continue
+            tag = row[tag_idx]
+            if tag not in assets_by_tag:
+                assets_by_tag[tag] = {'paths': [], 'names': []}
+            assets_by_tag[tag]['paths'].append(row[path_idx])
+            assets_by_tag[tag]['names'].append(row[name_idx])
+    
+    return assets_by_tag
+
+
+# Single Anthropic client per process; planning agents reuse its HTTP connection pool
+_client: Optional[AsyncAnthropic] = None
+
+
+def _get_client() -> AsyncAnthropic:
+    """Create the shared Anthropic client on first use."""
+    global _client
+    if _client is None:
+        api_key = os.getenv("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise RuntimeError("Missing ANTHROPIC_API_KEY environment variable")
+        _client = AsyncAnthropic(api_key=api_key, max_retries=2)
+    return _client
 
 
 class ScenePlanningAgent:
@@ -14,16 +67,15 @@ class ScenePlanningAgent:
     
     def __init__(self):
         # Initialize Anthropic client
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise RuntimeError("Missing ANTHROPIC_API_KEY environment variable")
-        
-        self.client = Anthropic(api_key=api_key)
+        self.client = _get_client()
         self.model = "claude-3-haiku-20240307"
         
         # Get project root (2 levels up from scene_planning_agent/core.py)
         self.project_root = Path(__file__).parent.parent.parent
         
+        # Parsed configs keyed on the whitespace/case-normalized description
+        self._parse_cache: OrderedDict = OrderedDict()
+        
         # System prompt for parsing
         self.system_prompt = """Extract objects and quantities from the scene description.
 
@@ -42,9 +94,15 @@ Output JSON format:
 
 Only include what's explicitly mentioned. Keep it simple."""
 
-    def parse_description(self, description: str) -> dict:
+    async def parse_description(self, description: str) -> dict:
         """Parse natural language description into structured format."""
-        response = self.client.messages.create(
+        cache_key = " ".join(description.lower().split())
+        cached = self._parse_cache.get(cache_key)
+        if cached is not None:
+            self._parse_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+        
+        response = await self.client.messages.create(
             model=self.model,
             max_tokens=500,
             system=self.system_prompt,
@@ -53,17 +111,22 @@ Only include what's explicitly mentioned. Keep it simple."""
         
         # Extract JSON from response
         content = response.content[0].text
-        if "```json" in content:
-            json_str = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            json_str = content.split("```")[1].split("```")[0]
-        else:
-            json_str = content
-            
-        return json.loads(json_str.strip())
+        match = _JSON_RE.search(content)
+        json_str = (match.group(1) or match.group(2)) if match else content.strip()
+        
+        try:
+            config = json_loads(json_str)
+        except ValueError:
+            # orjson rejects text the stdlib still accepts (e.g. lone surrogates in model output)
+            config = json.loads(json_str)
+        
+        self._parse_cache[cache_key] = copy.deepcopy(config)
+        if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return config
     
-    def load_assets_csv(self, csv_path: str) -> Dict[str, List[Dict]]:
-        """Load assets.csv and organize by tag."""
+    def load_assets_csv(self, csv_path: str) -> Dict[str, Dict[str, List[str]]]:
+        """Load assets.csv and organize by tag as parallel 'paths' / 'names' lists."""
         # Handle both absolute and relative paths
         if not os.path.isabs(csv_path):
             # If relative path, make it relative to project root
@@ -74,29 +137,16 @@ Only include what's explicitly mentioned. Keep it simple."""
         if not csv_path.exists():
             raise FileNotFoundError(f"Assets CSV not found at: {csv_path}")
         
-        assets_by_tag = {}
-        
-        with open(csv_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                tag = row['tag']
-                if tag not in assets_by_tag:
-                    assets_by_tag[tag] = []
-                assets_by_tag[tag].append({
-                    'file_path': row['file path'],
-                    'file_name': row['file name']
-                })
-        
-        return assets_by_tag
+        # Reuse the previous parse if the file has not changed on disk
+        st = csv_path.stat()
+        return _parse_assets_csv(str(csv_path), st.st_mtime_ns, st.st_size)
     
-    def generate_combinations(self, config: dict, assets_by_tag: Dict[str, List[Dict]], 
+    def generate_combinations(self, config: dict, assets_by_tag: Dict[str, Dict[str, List[str]]], 
                             num_combinations: int = 10) -> Optional[List[Dict]]:
         """Generate asset combinations based on configuration."""
         # Verify required objects
-        missing_assets = []
-        for obj in config['objects']:
-            if obj['name'] not in assets_by_tag:
-                missing_assets.append(obj['name'])
+        required = {obj['name'] for obj in config['objects']}
+        missing_assets = sorted(required - assets_by_tag.keys())
         
         if missing_assets:
             return {
@@ -104,48 +154,52 @@ Only include what's explicitly mentioned. Keep it simple."""
                 "missing_assets": missing_assets
             }
         
-        combinations = []
+        # Per object type: its instance ids and the picks for every combination, drawn at once
+        blocks = []
+        for obj in config['objects']:
+            available = assets_by_tag[obj['name']]
+            quantity = obj['quantity']
+            
+            # Special case: if object type is 'house' and quantity is 1, use 'house' as instance_id
+            if obj['name'] == 'house' and quantity == 1:
+                iids = ['house']
+            else:
+                iids = [f"{obj['name']}_{k + 1}" for k in range(quantity)]
+            
+            selected = random.choices(range(len(available['paths'])), k=num_combinations * quantity)
+            blocks.append((obj['name'], iids, available['paths'], available['names'], selected))
         
         # Generate combinations
-        for i in range(num_combinations):
-            combo = {
+        combinations = [
+            {
                 'combination_id': i + 1,
-                'objects': []
+                'objects': [
+                    {
+                        'type': name,
+                        'instance_id': iid,
+                        'file_path': paths[asset_idx],
+                        'file_name': names[asset_idx]
+                    }
+                    for name, iids, paths, names, selected in blocks
+                    for iid, asset_idx in zip(iids, selected[i * len(iids):(i + 1) * len(iids)])
+                ]
             }
-            
-            for obj in config['objects']:
-                available = assets_by_tag[obj['name']]
-                selected = random.choices(available, k=obj['quantity'])
-                
-                for idx, file_info in enumerate(selected):
-                    # Special case: if object type is 'house' and quantity is 1, use 'house' as instance_id
-                    if obj['name'] == 'house' and obj['quantity'] == 1:
-                        instance_id = 'house'
-                    else:
-                        instance_id = f"{obj['name']}_{idx + 1}"
-                    
-                    combo['objects'].append({
-                        'type': obj['name'],
-                        'instance_id': instance_id,
-                        'file_path': file_info['file_path'],
-                        'file_name': file_info['file_name']
-                    })
-            
-            combinations.append(combo)
+            for i in range(num_combinations)
+        ]
         
         return combinations
     
-    def plan_scene(self, description: str, assets_csv_path: str, 
+    async def plan_scene(self, description: str, assets_csv_path: str, 
                    num_combinations) -> dict:
         """
         Parse description and generate scene combinations.
         """
         try:
             # Step 1: Parse natural language description
-            config = self.parse_description(description)
+            config = await self.parse_description(description)
             
-            # Step 2: Load available assets
-            assets_by_tag = self.load_assets_csv(assets_csv_path)
+            # Step 2: Load available assets (off the event loop when the CSV has to be re-read)
+            assets_by_tag = await asyncio.to_thread(self.load_assets_csv, assets_csv_path)
             
             # Step 3: Generate combinations
             combinations = self.generate_combinations(
@@ -1,9 +1,13 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional
 from core import ScenePlanningAgent
 
-app = FastAPI(title="Scene Planning Agent")
+app = FastAPI(title="Scene Planning Agent", default_response_class=ORJSONResponse)
+# /plan-scene returns many combinations whose file paths share long prefixes, so they compress well
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 agent = ScenePlanningAgent()
 
 class PlanSceneRequest(BaseModel):
@@ -19,10 +23,17 @@ class PlanSceneResponse(BaseModel):
     combinations: Optional[list] = None
     missing_assets: Optional[list] = None
 
+@app.on_event("startup")
+async def preload_assets():
+    """Parse the project's assets.csv once so the first /plan-scene hits the cache"""
+    default_csv = agent.project_root / "Assets" / "assets.csv"
+    if default_csv.exists():
+        agent.load_assets_csv(str(default_csv))
+
 @app.post("/plan-scene", response_model=PlanSceneResponse)
 async def plan_scene(req: PlanSceneRequest):
     try:
-        result = agent.plan_scene(
+        result = await agent.plan_scene(
             description=req.description,
             assets_csv_path=req.assets_csv_path,
             num_combinations=req.num_combinations
@@ -33,4 +44,10 @@ async def plan_scene(req: PlanSceneRequest):
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy", "agent": "scene_planning"}
\ No newline at end of file
+    return {"status": "healthy", "agent": "scene_planning"}
+
+if __name__ == "__main__":
+    import uvicorn
+    # Single worker: the agent keeps its caches and connection pools in-process
+    uvicorn.run("main:app", host="0.0.0.0", port=8003, loop="auto", http="auto",
+                workers=1, access_log=False)
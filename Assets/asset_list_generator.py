@@ -1,42 +1,46 @@
 import os
 import csv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# supported 3D file extensions, as a tuple so str.endswith checks them all in one call
+EXTS = ('.fbx', '.obj', '.gltf', '.glb', '.dae', '.stl', '.blend')
+
+
+def _iter_3d_files(folder, tag):
+    """
+    recursively yields [full path, file name, tag] for every 3D file below folder
+    """
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            # DirEntry caches the file type, so no extra stat per entry
+            if entry.is_dir(follow_symlinks=False):
+                # files inside a subfolder are tagged with that subfolder's name
+                yield from _iter_3d_files(entry.path, entry.name)
+            elif entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(EXTS):
+                yield [entry.path, entry.name, tag]
+
+
 def scan_3d_files(folder_path, output_csv='3d_files_scan.csv'):
     """
     scans the "Asseets" folder for 3D files and generates a CSV record
     """
     
-    # supported 3D file extensions 
-    extensions = ['.fbx', '.obj', '.gltf', '.glb', '.dae', '.stl', '.blend']
-    
-    # store results
-    results = []
-
     # convert to Path object
     root_path = Path(folder_path)
 
-    # recursively scan the folder
-    for file_path in root_path.rglob('*'):
-        # check if it's a file and the extension matches
-        if file_path.is_file() and file_path.suffix.lower() in extensions:
-            # get the full path of the file
-            full_path = str(file_path)
-
-            # get the file name
-            file_name = file_path.name
-            
-            # get the parent folder name as tag
-            # if the file is directly under the root directory, use the root directory name
-            if file_path.parent == root_path:
-                tag = root_path.name
-            else:
-                tag = file_path.parent.name
-            
-            results.append([full_path, file_name, tag])
-
-    # write to CSV file
-    with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
+    # store results; files directly under the root directory use the root directory name as tag
+    results = []
+    subfolders = []
+    with os.scandir(root_path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subfolders.append(entry)
+            elif entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(EXTS):
+                results.append([entry.path, entry.name, root_path.name])
+
+    # write to CSV file, with a large buffer so rows are flushed to disk in big chunks
+    with open(output_csv, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
         writer = csv.writer(csvfile)
 
         # write header
@@ -45,6 +49,15 @@ def scan_3d_files(folder_path, output_csv='3d_files_scan.csv'):
         # write data
         writer.writerows(results)
 
+        # scandir releases the GIL, so walk each top-level folder in its own thread;
+        # map keeps the folders in listing order so the CSV is the same as a serial scan,
+        # and each folder's rows are written once that folder and the ones before it are scanned
+        with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4) as executor:
+            batches = executor.map(lambda entry: list(_iter_3d_files(entry.path, entry.name)), subfolders)
+            for batch in batches:
+                writer.writerows(batch)
+                results.extend(batch)
+
     print(f"Scan complete! Found {len(results)} 3D files.")
     print(f"Results saved to: {output_csv}")
 
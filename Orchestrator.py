@@ -1,16 +1,34 @@
 import httpx
-import json
 import time
 import asyncio
+import random
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 import logging
 import os
+import re
+from orjson import dumps as json_dumps, loads as json_loads
+
+# Request bodies are pre-encoded, so the content type has to be set explicitly
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Seconds a successful health probe is trusted before the agent is probed again
+_HEALTH_TTL = 60.0
+
+
+def _keyword_re(keywords) -> Optional["re.Pattern"]:
+    """Case-insensitive matcher for any of the keywords, or None when there are none."""
+    if not keywords:
+        return None
+    return re.compile("|".join(map(re.escape, sorted(keywords))), re.IGNORECASE)
 
 class Orchestrator:
     """Main orchestrator that coordinates all agents"""
     
-    def __init__(self, enable_review: bool = True, review_only_steps: Optional[Set[str]] = None):
+    def __init__(self, enable_review: bool = True, review_only_steps: Optional[Set[str]] = None,
+                 max_retries: int = 5,
+                 backoff_base: float = 1.0, backoff_cap: float = 30.0, persist_to_disk: bool = False,
+                 step_budget: Optional[float] = 300.0):
         self.agents = {
             "execution": "http://localhost:8001",
             "reviewing": "http://localhost:8002", 
@@ -20,8 +38,12 @@ class Orchestrator:
         self.project_root = Path(__file__).parent
         self.logger = self._setup_logger()
         self.timeout = httpx.Timeout(1000, connect=10.0)
+        # Shared HTTP client so calls to the agents reuse keep-alive connections; opened per workflow
+        self.client: Optional[httpx.AsyncClient] = None
+        
+        # Agent name -> time.monotonic() of its last successful health probe
+        self._health_cache: Dict[str, float] = {}
         self.current_combination = None
-        self.total_steps = 0
         # REMOVED: self.reviewing_images_dir - no longer needed
         
         # Review control
@@ -32,35 +54,105 @@ class Orchestrator:
         # Steps that never need review
         self.skip_review_steps = {"clear_scene", "add_ground", "capture_scene_views", "place_objects_around_house"}
         
+        # Both keyword sets compiled once, since every step description is matched against them
+        self._review_only_re = _keyword_re(self.review_only_steps)
+        self._skip_review_re = _keyword_re(self.skip_review_steps)
+        
+        # Also have the coding agent write each combination's script to execution_code_<id>.py
+        self.persist_to_disk = persist_to_disk
+        
+        # The Blender scene and the coding agent hold one combination at a time, so a combination's
+        # whole workflow runs under this lock, even if run_workflow is called concurrently
+        self._scene_lock = asyncio.Lock()
+        
+        # Attempts per step before the combination is given up, and the full-jitter backoff
+        # after a failed review request: uniform(0, min(cap, base * 2**attempt)) seconds
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        # Wall-clock seconds one step may spend across all its attempts before it is given up (None: no limit)
+        self.step_budget = step_budget
+        
+    async def __aenter__(self):
+        if self.client is None:
+            self.client = self._create_client()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        )
+    
+    async def close(self):
+        """Close the shared HTTP client"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+        
+    async def _post_json(self, url: str, payload: Dict) -> Dict:
+        """POST a JSON payload to an agent and decode its JSON reply"""
+        response = await self.client.post(url, content=json_dumps(payload), headers=_JSON_HEADERS)
+        # Agents answer failures they can't express in their payload with an HTTP error status
+        response.raise_for_status()
+        return json_loads(response.content)
+    
     def _setup_logger(self):
         logger = logging.getLogger('Orchestrator')
         logger.setLevel(logging.INFO)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        # The logger is process-wide; only attach the handler for the first Orchestrator
+        if not logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
         return logger
     
-    async def check_agents_health(self):
-        """Check if all agents are running"""
+    async def _probe(self, name: str, url: str, force: bool = False):
+        """Probe one agent's /health endpoint, returning (name, ok, error)"""
+        # Recently healthy agents are not probed again; failures are always re-checked
+        checked_at = self._health_cache.get(name)
+        if not force and checked_at is not None and time.monotonic() - checked_at < _HEALTH_TTL:
+            return name, True, None
+        
+        try:
+            response = await self.client.get(f"{url}/health")
+            if response.status_code == 200:
+                self._health_cache[name] = time.monotonic()
+                return name, True, None
+            self._health_cache.pop(name, None)
+            return name, False, f"status {response.status_code}"
+        except Exception as e:
+            self._health_cache.pop(name, None)
+            return name, False, e
+    
+    async def check_agents_health(self, force: bool = False):
+        """Check if all agents are running; force skips the cached results"""
+        agents = {}
         for name, url in self.agents.items():
             # Skip review agent if disabled
             if name == "reviewing" and not self.enable_review:
-                self.logger.info(f"✓ {name} agent skipped (review disabled)")
+                self.logger.info("✓ %s agent skipped (review disabled)", name)
                 continue
-                
-            try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(f"{url}/health")
-                    if response.status_code == 200:
-                        self.logger.info(f"✓ {name} agent is healthy")
-                    else:
-                        self.logger.error(f"✗ {name} agent is unhealthy")
-                        return False
-            except Exception as e:
-                self.logger.error(f"✗ {name} agent is not reachable: {e}")
-                return False
-        return True
+            agents[name] = url
+        
+        # Probe all agents at once so one slow or unreachable agent doesn't delay the others
+        results = await asyncio.gather(*(self._probe(name, url, force) for name, url in agents.items()))
+        
+        healthy = True
+        for name, ok, err in results:
+            if ok:
+                self.logger.info("✓ %s agent is healthy", name)
+            elif isinstance(err, Exception):
+                self.logger.error("✗ %s agent is not reachable: %s", name, err)
+                healthy = False
+            else:
+                self.logger.error("✗ %s agent is unhealthy", name)
+                healthy = False
+        return healthy
     
     async def plan_scene(self, description: str, assets_csv_path: str, num_combinations: int = 1):
         """Step 1: Use scene planning agent to parse description and generate combinations"""
@@ -68,37 +160,31 @@ class Orchestrator:
         
         # Convert to absolute path
         abs_path = str(Path(assets_csv_path).absolute())
-        self.logger.info(f"Using assets CSV at: {abs_path}")
-        
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.agents['scene_planning']}/plan-scene",
-                json={
-                    "description": description,
-                    "assets_csv_path": abs_path,
-                    "num_combinations": num_combinations
-                }
-            )
-            
-        result = response.json()
+        self.logger.info("Using assets CSV at: %s", abs_path)
+        
+        result = await self._post_json(
+            f"{self.agents['scene_planning']}/plan-scene",
+            {
+                "description": description,
+                "assets_csv_path": abs_path,
+                "num_combinations": num_combinations
+            }
+        )
         if not result["success"]:
-            self.logger.error(f"Scene planning failed: {result.get('error', 'Unknown error')}")
+            self.logger.error("Scene planning failed: %s", result.get('error', 'Unknown error'))
             if "missing_assets" in result:
-                self.logger.error(f"Missing assets: {result['missing_assets']}")
+                self.logger.error("Missing assets: %s", result['missing_assets'])
             return None
             
-        self.logger.info(f"Scene planning successful. Generated {result['total_combinations']} combinations")
+        self.logger.info("Scene planning successful. Generated %s combinations", result['total_combinations'])
         return result
     
     async def set_combination_in_coding_agent(self, combination: Dict):
         """Send combination data to coding agent"""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.agents['coding']}/set-combination",
-                json={"combination": combination}
-            )
-        
-        result = response.json()
+        result = await self._post_json(
+            f"{self.agents['coding']}/set-combination",
+            {"combination": combination, "persist_to_disk": self.persist_to_disk}
+        )
         if not result["success"]:
             raise RuntimeError(f"Failed to set combination data: {result.get('message')}")
         
@@ -109,29 +195,45 @@ class Orchestrator:
         # If review is globally disabled
         if not self.enable_review:
             # But check if this is a critical step that always needs review
-            for critical_step in self.review_only_steps:
-                if critical_step.lower() in step_description.lower():
-                    self.logger.info(f"Step {step_num} requires review (critical step: {critical_step})")
-                    return True
+            match = self._review_only_re and self._review_only_re.search(step_description)
+            if match:
+                self.logger.info("Step %s requires review (critical step: %s)", step_num, match.group(0).lower())
+                return True
             return False
         
         # If review is enabled, check if this step should be skipped
-        for skip_step in self.skip_review_steps:
-            if skip_step.lower() in step_description.lower():
-                self.logger.info(f"Step {step_num} skipped review (type: {skip_step})")
-                return False
+        match = self._skip_review_re and self._skip_review_re.search(step_description)
+        if match:
+            self.logger.info("Step %s skipped review (type: %s)", step_num, match.group(0).lower())
+            return False
         
         return True
         
     async def get_step_info(self, step_num: int) -> Dict:
         """Get information about a specific step from the generated code"""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.agents['coding']}/get-step-info",
-                json={"step": step_num}
-            )
-        
-        return response.json()
+        return await self._post_json(
+            f"{self.agents['coding']}/get-step-info",
+            {"step": step_num}
+        )
+    
+    async def get_step_code(self, step_num: int) -> Dict:
+        """Get the code for a specific step from the generated code"""
+        return await self._post_json(
+            f"{self.agents['coding']}/get-step-code",
+            {"step": step_num}
+        )
+    
+    async def get_all_steps(self):
+        """Get the info and code of every generated step in one request, each keyed by step number"""
+        result = await self._post_json(f"{self.agents['coding']}/get-all-steps", {})
+        step_infos: Dict[int, Dict] = {}
+        step_codes: Dict[int, str] = {}
+        for step in result.get("steps", []):
+            code = step.pop("code", None)
+            step_infos[step["step"]] = step
+            if code is not None:
+                step_codes[step["step"]] = code
+        return step_infos, step_codes
     
     async def execute_workflow_steps(self, combination: Dict):
         """Execute all workflow steps with review loop"""
@@ -141,205 +243,218 @@ class Orchestrator:
         # Generate complete code on step 1
         self.logger.info("Generating complete scene construction code...")
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.agents['coding']}/generate-code",
-                json={
-                    "step": 1,
-                    "task_description": "Generate complete scene construction code with intelligent scaling",
-                    "review_result": None
-                }
-            )
-        
-        code_result = response.json()
+        code_result = await self._post_json(
+            f"{self.agents['coding']}/generate-code",
+            {
+                "step": 1,
+                "task_description": "Generate complete scene construction code with intelligent scaling",
+                "review_result": None
+            }
+        )
         if not code_result["success"]:
-            self.logger.error(f"Code generation failed: {code_result['message']}")
+            self.logger.error("Code generation failed: %s", code_result['message'])
             return False
         
-        self.total_steps = code_result.get("total_steps", 0)
-        self.logger.info(f"Generated code with {self.total_steps} steps")
+        total_steps = code_result.get("total_steps", 0)
+        self.logger.info("Generated code with %s steps", total_steps)
+        
+        # Every step's info and code up front; kept local so they always belong to this combination
+        step_infos, step_codes = await self.get_all_steps()
         
         # Execute each step
-        for step_num in range(1, self.total_steps + 1):
-            self.logger.info(f"\n--- Executing Step {step_num}/{self.total_steps} ---")
+        for step_num in range(1, total_steps + 1):
+            self.logger.info("\n--- Executing Step %s/%s ---", step_num, total_steps)
             
             # Get step information
-            step_info = await self.get_step_info(step_num)
+            step_info = step_infos.get(step_num) or await self.get_step_info(step_num)
             step_description = step_info.get("description", f"Step {step_num}")
             
-            max_retries = 5
-            retry_count = 0
-            review_result = None
-            
-            while retry_count < max_retries:
-                # Get the code for this specific step
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(
-                        f"{self.agents['coding']}/get-step-code",
-                        json={"step": step_num}
-                    )
-                
-                step_code_result = response.json()
+            # Run the step's attempts under the wall-clock budget, so a hung request can't stall it
+            try:
+                step_ok = await asyncio.wait_for(
+                    self._run_step(step_num, step_description, step_codes), self.step_budget
+                )
+            except asyncio.TimeoutError:
+                self.logger.error("Step %s exceeded its %gs budget", step_num, self.step_budget)
+                return False
+            if not step_ok:
+                return False
+        
+        # If we get here, all steps completed successfully
+        return True
+    
+    async def _run_step(self, step_num: int, step_description: str, step_codes: Dict[int, str]) -> bool:
+        """Execute one step, fixing and re-running it until it passes review or runs out of attempts"""
+        max_retries = self.max_retries
+        retry_count = 0
+        review_result = None
+        # The review request is the same for every attempt at this step, so encode it once
+        review_body = json_dumps({
+            "step": step_num,
+            "description": step_description,
+            "edit_hint": "Check if objects are properly sized relative to the house based on bounding box dimensions."
+        })
+        
+        while retry_count < max_retries:
+            # Get the code for this specific step (fetched above unless it could not be extracted)
+            step_code = step_codes.get(step_num)
+            if step_code is None:
+                step_code_result = await self.get_step_code(step_num)
                 if not step_code_result["success"]:
-                    self.logger.error(f"Failed to get code for step {step_num}")
+                    self.logger.error("Failed to get code for step %s", step_num)
                     return False
+                step_code = step_codes[step_num] = step_code_result["code"]
+            
+            # For steps after 1 with failed review, fix the code
+            if review_result and not review_result.get("ok", False):
+                self.logger.info("Fixing step %s based on review feedback...", step_num)
                 
-                step_code = step_code_result["code"]
-                
-                # For steps after 1 with failed review, fix the code
-                if review_result and not review_result.get("ok", False):
-                    self.logger.info(f"Fixing step {step_num} based on review feedback...")
-                    
-                    async with httpx.AsyncClient(timeout=self.timeout) as client:
-                        response = await client.post(
-                            f"{self.agents['coding']}/generate-code",
-                            json={
-                                "step": step_num,
-                                "task_description": step_description,
-                                "review_result": review_result
-                            }
-                        )
-                    
-                    code_result = response.json()
-                    if not code_result["success"]:
-                        self.logger.error(f"Code fix failed: {code_result['message']}")
-                        return False
-                    
-                    # Get the updated step code
-                    async with httpx.AsyncClient(timeout=self.timeout) as client:
-                        response = await client.post(
-                            f"{self.agents['coding']}/get-step-code",
-                            json={"step": step_num}
-                        )
-                    
-                    step_code_result = response.json()
-                    if not step_code_result["success"]:
-                        self.logger.error(f"Failed to get updated code for step {step_num}")
-                        return False
-                    
-                    step_code = step_code_result["code"]
-                
-                # Execute only this step's code in Blender
-                self.logger.info(f"Executing step {step_num} code in Blender...")
-                
-                # Never capture views anymore
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(
-                        f"{self.agents['execution']}/run-step-code",
-                        json={
-                            "code": step_code,
-                            "capture_views": False
-                        }
-                    )
-                
-                exec_result = response.json()
-                if not exec_result.get("ok", False):
-                    error_msg = exec_result.get('error') or exec_result.get('result', {}).get('error', 'Unknown error')
-                    self.logger.error(f"Step {step_num} execution failed: {error_msg}")
+                # Regenerate the step and get its new code in one round trip
+                code_result = await self._post_json(
+                    f"{self.agents['coding']}/generate-and-get-step-code",
+                    {
+                        "step": step_num,
+                        "task_description": step_description,
+                        "review_result": review_result
+                    }
+                )
+                if not code_result["success"]:
+                    self.logger.error("Code fix failed: %s", code_result['message'])
                     return False
                 
-                self.logger.info(f"Step {step_num} executed successfully")
-                
-                # Shorter delay - no image capture needed
-                await asyncio.sleep(0.5)
-                
-                # Determine if this step needs review
-                if not self._should_review_step(step_num, step_description):
-                    self.logger.info(f"✓ Step {step_num} completed (review skipped)")
-                    break
-                
-                # Review the step using bounding box data
-                self.logger.info(f"Reviewing step {step_num}...")
+                step_code = step_codes[step_num] = code_result["code"]
+            
+            # Execute only this step's code in Blender
+            self.logger.info("Executing step %s code in Blender...", step_num)
+            
+            # Never capture views anymore
+            exec_result = await self._post_json(
+                f"{self.agents['execution']}/run-step-code",
+                {
+                    "code": step_code,
+                    "capture_views": False
+                }
+            )
+            if not exec_result.get("ok", False):
+                error_msg = exec_result.get('error') or (exec_result.get('result') or {}).get('error') or 'Unknown error'
+                self.logger.error("Step %s execution failed: %s", step_num, error_msg)
+                return False
+            
+            self.logger.info("Step %s executed successfully", step_num)
+            
+            # Determine if this step needs review
+            if not self._should_review_step(step_num, step_description):
+                self.logger.info("✓ Step %s completed (review skipped)", step_num)
+                return True
+            
+            # Review the step using bounding box data
+            self.logger.info("Reviewing step %s...", step_num)
+            # Set when the review request itself failed, as opposed to a negative verdict
+            review_unavailable = False
 
-                try:
-                    async with httpx.AsyncClient(timeout=self.timeout) as client:
-                        response = await client.post(
-                            f"{self.agents['reviewing']}/review",
-                            json={
-                                "step": step_num,
-                                "description": step_description,
-                                "edit_hint": "Check if objects are properly sized relative to the house based on bounding box dimensions."
-                            }
-                        )
+            try:
+                response = await self.client.post(
+                    f"{self.agents['reviewing']}/review",
+                    content=review_body,
+                    headers=_JSON_HEADERS
+                )
+                
+                # Check if response is valid
+                if response.status_code != 200:
+                    self.logger.error("Review request failed with status %s", response.status_code)
+                    review_unavailable = True
+                    review_result = {"ok": False, "comment": f"Review request failed with status {response.status_code}"}
+                else:
+                    review_result = json_loads(response.content)
                     
-                    # Check if response is valid
-                    if response.status_code != 200:
-                        self.logger.error(f"Review request failed with status {response.status_code}")
-                        review_result = {"ok": False, "comment": f"Review request failed with status {response.status_code}"}
-                    else:
-                        review_result = response.json()
+                    # Validate review result format
+                    if not isinstance(review_result, dict):
+                        self.logger.error("Invalid review result format: %s", review_result)
+                        review_result = {"ok": False, "comment": "Invalid review result format"}
+                    elif "ok" not in review_result:
+                        self.logger.error("Review result missing 'ok' field: %s", review_result)
+                        review_result = {"ok": False, "comment": "Review result missing 'ok' field"}
                         
-                        # Validate review result format
-                        if not isinstance(review_result, dict):
-                            self.logger.error(f"Invalid review result format: {review_result}")
-                            review_result = {"ok": False, "comment": "Invalid review result format"}
-                        elif "ok" not in review_result:
-                            self.logger.error(f"Review result missing 'ok' field: {review_result}")
-                            review_result = {"ok": False, "comment": "Review result missing 'ok' field"}
-                            
-                except Exception as e:
-                    self.logger.error(f"Review request failed: {str(e)}")
-                    review_result = {"ok": False, "comment": f"Review request failed: {str(e)}"}
+            except Exception as e:
+                self.logger.error("Review request failed: %s", e)
+                review_unavailable = True
+                review_result = {"ok": False, "comment": f"Review request failed: {str(e)}"}
 
-                # Now safely check the result
-                if review_result.get("ok", False):
-                    self.logger.info(f"✓ Step {step_num} passed review")
-                    break
-                else:
-                    retry_count += 1
-                    comment = review_result.get("comment", "No comment provided")
-                    self.logger.warning(f"✗ Step {step_num} failed review: {comment}")
-                    
-                    if retry_count < max_retries:
-                        self.logger.info(f"Retrying step {step_num} (attempt {retry_count + 1}/{max_retries})")
+            # Now safely check the result
+            if review_result.get("ok", False):
+                self.logger.info("✓ Step %s passed review", step_num)
+                return True
+            else:
+                retry_count += 1
+                comment = review_result.get("comment", "No comment provided")
+                self.logger.warning("✗ Step %s failed review: %s", step_num, comment)
+                
+                if retry_count < max_retries:
+                    if review_unavailable:
+                        # Exponential backoff with full jitter so a flapping agent isn't hit back-to-back
+                        delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** retry_count))
+                        self.logger.info("Retrying step %s in %.1fs (attempt %s/%s)", step_num, delay, retry_count + 1, max_retries)
+                        await asyncio.sleep(delay)
                     else:
-                        self.logger.error(f"Step {step_num} failed after {max_retries} attempts")
-                        return False
+                        # A negative verdict is not transient; fix the step right away
+                        self.logger.info("Retrying step %s (attempt %s/%s)", step_num, retry_count + 1, max_retries)
+                else:
+                    self.logger.error("Step %s failed after %s attempts", step_num, max_retries)
+                    return False
         
-        # If we get here, all steps completed successfully
         return True
     
     # REMOVED: _capture_scene_views method - no longer needed
     
     async def generate_scene_for_combination(self, combination: Dict, combination_num: int):
         """Generate scene for a single combination"""
-        self.logger.info(f"\n{'='*60}")
-        self.logger.info(f"Generating scene for combination {combination_num}")
-        self.logger.info(f"Objects in this combination:")
+        self.logger.info("\n%s", '='*60)
+        self.logger.info("Generating scene for combination %s", combination_num)
+        self.logger.info("Objects in this combination:")
         for obj in combination["objects"]:
-            self.logger.info(f"  - {obj['instance_id']}: {obj['file_name']}")
-        self.logger.info(f"{'='*60}")
-        
-        # Clear any existing execution_code.py to start fresh
-        execution_code_path = Path("execution_code.py")
-        if execution_code_path.exists():
-            execution_code_path.unlink()
-            self.logger.info("Cleared existing execution_code.py")
+            self.logger.info("  - %s: %s", obj['instance_id'], obj['file_name'])
+        self.logger.info("%s", '='*60)
         
         # Store combination data
         self.current_combination = combination
         
         # Execute workflow steps with combination data
-        success = await self.execute_workflow_steps(combination)
+        try:
+            async with self._scene_lock:
+                success = await self.execute_workflow_steps(combination)
+        except httpx.HTTPStatusError as e:
+            self.logger.error("%s returned HTTP %s: %s", e.request.url, e.response.status_code, e.response.text)
+            success = False
         
         if success:
-            self.logger.info(f"\n✓ Successfully generated scene for combination {combination_num}")
+            self.logger.info("\n✓ Successfully generated scene for combination %s", combination_num)
         else:
-            self.logger.error(f"\n✗ Failed to generate scene for combination {combination_num}")
+            self.logger.error("\n✗ Failed to generate scene for combination %s", combination_num)
         
         return success
     
     async def run_workflow(self, description: str, assets_csv_path: str, num_combinations: int = 1):
         """Main workflow execution"""
+        # Open the shared client for this run unless the caller already did (async with Orchestrator())
+        owns_client = self.client is None
+        if owns_client:
+            self.client = self._create_client()
+        try:
+            await self._run_workflow(description, assets_csv_path, num_combinations)
+        finally:
+            if owns_client:
+                await self.close()
+    
+    async def _run_workflow(self, description: str, assets_csv_path: str, num_combinations: int):
         self.logger.info("\n" + "="*80)
         self.logger.info("STARTING SCENE GENERATION WORKFLOW")
         self.logger.info("="*80)
-        self.logger.info(f"Description: {description}")
-        self.logger.info(f"Assets CSV: {assets_csv_path}")
-        self.logger.info(f"Number of combinations: {num_combinations}")
-        self.logger.info(f"Review enabled: {self.enable_review}")
+        self.logger.info("Description: %s", description)
+        self.logger.info("Assets CSV: %s", assets_csv_path)
+        self.logger.info("Number of combinations: %s", num_combinations)
+        self.logger.info("Review enabled: %s", self.enable_review)
         if not self.enable_review:
-            self.logger.info(f"Review-only steps: {self.review_only_steps}")
+            self.logger.info("Review-only steps: %s", self.review_only_steps)
         
         # Check all agents are healthy
         self.logger.info("\nChecking agent health...")
@@ -349,15 +464,20 @@ class Orchestrator:
         
         # Plan the scene
         self.logger.info("\nStep 1: Scene Planning")
-        planning_result = await self.plan_scene(description, assets_csv_path, num_combinations)
+        try:
+            planning_result = await self.plan_scene(description, assets_csv_path, num_combinations)
+        except httpx.HTTPStatusError as e:
+            self.logger.error("Scene planning returned HTTP %s: %s", e.response.status_code, e.response.text)
+            planning_result = None
         if not planning_result:
             return
         
         # Process each combination
+        # All combinations share one Blender scene and one coding agent, so they run one at a time
         combinations = planning_result["combinations"]
         successful_combinations = 0
         
-        for idx, combination in enumerate(combinations):
+        for combination in combinations:
             combination_num = combination["combination_id"]
             
             if await self.generate_scene_for_combination(combination, combination_num):
@@ -365,16 +485,11 @@ class Orchestrator:
                 
                 # Optionally save/export the scene here
                 # You might want to add code to save the .blend file or export images
-                
-            # Add a delay between combinations if needed
-            if idx < len(combinations) - 1:
-                self.logger.info("\nWaiting before next combination...")
-                await asyncio.sleep(5)
         
         # Final summary
         self.logger.info("\n" + "="*80)
         self.logger.info("WORKFLOW COMPLETED")
-        self.logger.info(f"Successfully generated: {successful_combinations}/{len(combinations)} scenes")
+        self.logger.info("Successfully generated: %s/%s scenes", successful_combinations, len(combinations))
         self.logger.info("="*80)
 
 async def main():
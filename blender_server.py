@@ -1,19 +1,51 @@
 import bpy
+import numpy as np
+import math
+import os
+import random
 import socket
+import sys
+import functools
 import threading
 import json
 import queue
+import struct
 import time
+from mathutils import Vector
 
 # global message queue for inter-thread communication
 message_queue = queue.Queue()
+
+# Most messages handled per timer tick, so a burst can't freeze the Blender UI
+MAX_BATCH = 8
+# Seconds between timer ticks that check the message queue
+TIMER_INTERVAL = 0.02
 server_running = False
 
+# Make the scene construction API importable; it lives next to this script
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+# Globals every step runs with, so step code doesn't need its own import header
+_EXEC_GLOBALS = {'bpy': bpy, 'math': math, 'random': random, 'Vector': Vector, 'sys': sys, 'os': os}
+try:
+    exec('from API import *', _EXEC_GLOBALS)
+except ImportError as e:
+    print(f"Warning: scene construction API not available: {e}")
+
+@functools.lru_cache(maxsize=128)
+def compile_step(code):
+    """Compile step source once; retries and repeated steps reuse the code object"""
+    return compile(code, '<blender_step>', 'exec')
+
 def execute_code_safe(code):
     """Execute code and return result"""
     try:
-        namespace = {'bpy': bpy, '_result': None}
-        exec(code, namespace)
+        # Shallow copy of the prepared globals, so names don't leak from one step into the next
+        namespace = _EXEC_GLOBALS.copy()
+        namespace['_result'] = None
+        exec(compile_step(code), namespace)
         
         if '_result' in namespace and namespace['_result'] is not None:
             return {
@@ -26,39 +58,85 @@ def execute_code_safe(code):
     except Exception as e:
         return {'status': 'error', 'error': str(e)}
 
-def server_thread_func(port=8089):
-    """Server thread function"""
-    global server_running
+def get_object_bbox_data(obj_name):
+    """World-space bounding box dimensions, location and scale of an object"""
+    obj = bpy.data.objects.get(obj_name)
+    if not obj:
+        return None
     
-    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    server.settimeout(0.5)
-    server.bind(('localhost', port))
-    server.listen(1)
-    server_running = True
+    # Get bounding box corners in world space: one (8, 3) transform instead of eight Vector products
+    matrix = np.array(obj.matrix_world)
+    corners = np.array(obj.bound_box) @ matrix[:3, :3].T + matrix[:3, 3]
     
-    print(f"Blender server started on port {port}")
+    # Calculate dimensions with a single min/max reduction per bound
+    width, depth, height = (corners.max(axis=0) - corners.min(axis=0)).tolist()
     
-    while server_running:
-        try:
-            client, address = server.accept()
-            
+    return {
+        'name': obj_name,
+        'width': width,
+        'depth': depth,
+        'height': height,
+        'volume': width * depth * height,
+        'location': list(obj.location),
+        'scale': list(obj.scale)
+    }
+
+def bbox_safe(names):
+    """Collect bounding box data for the named objects that exist in the scene"""
+    try:
+        bbox_data = {}
+        for obj_name in names:
+            data = get_object_bbox_data(obj_name)
+            if data:
+                bbox_data[obj_name] = data
+        return {'status': 'success', 'error': None, 'data': bbox_data}
+    except Exception as e:
+        return {'status': 'error', 'error': str(e)}
+
+def handle_request(request):
+    """Dispatch a decoded request to its handler"""
+    op = request.get('op')
+    if op == 'exec':
+        return execute_code_safe(request['code'])
+    if op == 'bbox':
+        return bbox_safe(request.get('names', []))
+    return {'status': 'error', 'error': f"Unknown op: {op}"}
+
+def recv_exact(sock, n):
+    """Read exactly n bytes from the socket"""
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            raise ConnectionError("Connection closed by peer")
+        buf.extend(chunk)
+    return bytes(buf)
+
+def send_message(sock, payload):
+    """Send a payload prefixed with its 4-byte big-endian length"""
+    sock.sendall(struct.pack('>I', len(payload)) + payload)
+
+def client_thread_func(client):
+    """Serve length-prefixed requests on one connection until the client closes it"""
+    client.settimeout(None)
+    
+    try:
+        while server_running:
             # Receive data
-            data = b""
-            while True:
-                chunk = client.recv(4096)
-                if not chunk:
-                    break
-                data += chunk
-                if len(chunk) < 4096:
-                    break
-            
-            code = data.decode('utf-8')
+            try:
+                (length,) = struct.unpack('>I', recv_exact(client, 4))
+            except ConnectionError:
+                break
+            try:
+                request = json.loads(recv_exact(client, length))
+            except ValueError as e:
+                send_message(client, json.dumps({'status': 'error', 'error': f"Invalid request: {e}"}).encode('utf-8'))
+                continue
             
             # Put in queue for main thread to process
             response_queue = queue.Queue()
             message_queue.put({
-                'code': code,
+                'request': request,
                 'response_queue': response_queue
             })
             
@@ -68,9 +146,42 @@ def server_thread_func(port=8089):
             except queue.Empty:
                 result = {'status': 'error', 'error': 'Execution timeout'}
             
-            # Send response
-            client.send(json.dumps(result).encode('utf-8'))
-            client.close()
+            # Send response; the connection stays open for the next request
+            try:
+                payload = json.dumps(result).encode('utf-8')
+            except (TypeError, ValueError) as e:
+                # e.g. a step left a non-JSON value in _result; the step itself already ran
+                payload = json.dumps({'status': 'error', 'error': f"Result is not JSON serializable: {e}"}).encode('utf-8')
+            send_message(client, payload)
+    except Exception as e:
+        if server_running:
+            print(f"Client connection error: {e}")
+    finally:
+        client.close()
+
+def server_thread_func(port=8089):
+    """Server thread function"""
+    global server_running
+    
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.settimeout(0.5)
+    server.bind(('localhost', port))
+    server.listen(8)
+    server_running = True
+    
+    print(f"Blender server started on port {port}")
+    
+    while server_running:
+        try:
+            client, address = server.accept()
+            # Replies are small single frames; send them without waiting on Nagle/delayed ACK
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            
+            # Each connection is kept alive and served by its own thread
+            handler = threading.Thread(target=client_thread_func, args=(client,))
+            handler.daemon = True
+            handler.start()
             
         except socket.timeout:
             continue
@@ -83,25 +194,27 @@ def server_thread_func(port=8089):
 
 def process_messages():
     """Process pending messages - called by timer"""
-    try:
-        # Process one message per call to avoid blocking
-        if not message_queue.empty():
+    processed = False
+    # Drain up to MAX_BATCH messages per tick, so queued requests don't wait a tick each
+    for _ in range(MAX_BATCH):
+        try:
             msg = message_queue.get_nowait()
-            code = msg['code']
-            response_queue = msg['response_queue']
-            
-            # Execute code
-            result = execute_code_safe(code)
-            
-            # Send result back
-            response_queue.put(result)
-    except queue.Empty:
-        pass
-    except Exception as e:
-        print(f"Error processing message: {e}")
+        except queue.Empty:
+            break
+        
+        try:
+            # Execute code or run the requested handler
+            result = handle_request(msg['request'])
+        except Exception as e:
+            print(f"Error processing message: {e}")
+            result = {'status': 'error', 'error': str(e)}
+        
+        # Send result back
+        msg['response_queue'].put(result)
+        processed = True
     
-    # Keep the timer running
-    return 0.05  # Check every 50ms
+    # Keep the timer running; come straight back while requests are arriving, idle otherwise
+    return 0.0 if processed else TIMER_INTERVAL
 
 # Start everything when the script runs
 if __name__ == "__main__":
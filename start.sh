@@ -65,19 +65,19 @@ sleep 8
 # Start all agents in background with error logging
 echo "[2/6] Starting Execution Agent (background)..."
 cd "$PROJECT_ROOT/Agents/execution_agent"
-$PYTHON_PATH -m uvicorn main:app --host 0.0.0.0 --port 8001 > /tmp/execution_agent.log 2>&1 &
+$PYTHON_PATH -m uvicorn main:app --host 0.0.0.0 --port 8001 --loop uvloop --http httptools > /tmp/execution_agent.log 2>&1 &
 cd "$PROJECT_ROOT"
 sleep 3
 
 echo "[3/6] Starting Reviewing Agent (background)..."
 cd "$PROJECT_ROOT/Agents/reviewing_agent"
-$PYTHON_PATH -m uvicorn main:app --host 0.0.0.0 --port 8002 > /tmp/reviewing_agent.log 2>&1 &
+$PYTHON_PATH -m uvicorn main:app --host 0.0.0.0 --port 8002 --loop uvloop --http httptools > /tmp/reviewing_agent.log 2>&1 &
 cd "$PROJECT_ROOT"
 sleep 3
 
 echo "[4/6] Starting Scene Planning Agent (background)..."
 cd "$PROJECT_ROOT/Agents/scene_planning_agent"
-$PYTHON_PATH -m uvicorn main:app --host 0.0.0.0 --port 8003 > /tmp/scene_planning_agent.log 2>&1 &
+$PYTHON_PATH -m uvicorn main:app --host 0.0.0.0 --port 8003 --loop uvloop --http httptools > /tmp/scene_planning_agent.log 2>&1 &
 cd "$PROJECT_ROOT"
 sleep 3
 